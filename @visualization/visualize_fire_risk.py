@@ -1,296 +1,438 @@
+import hashlib
 import json
-import matplotlib.pyplot as plt
+import os
+import shutil
 import numpy as np
 import pandas as pd
-import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # Fall back to the standard library parser
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library serializer
+    orjson = None
+
+# Risk level colors (low, medium, high) and the score thresholds between them
+_PALETTE = np.array(['#10B981', '#F59E0B', '#EF4444'])
+_THRESH = np.array([33, 66])
+
+# Risk level label text and the y position each one is drawn at
+_RISK_LABELS = ('Low Risk', 'Medium Risk', 'High Risk')
+_RISK_LABEL_Y = (20, 50, 85)
+
+# seaborn's husl palette for 1-16 colors, precomputed so seaborn isn't needed
+_HUSL_PALETTES = {
+    1: ['#f77189'],
+    2: ['#f77189', '#36ada4'],
+    3: ['#f77189', '#50b131', '#3ba3ec'],
+    4: ['#f77189', '#97a431', '#36ada4', '#a48cf4'],
+    5: ['#f77189', '#ae9d31', '#33b07a', '#38a9c5', '#cc7af4'],
+    6: ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4'],
+    7: ['#f77189', '#c69432', '#82a931', '#34af8a', '#37aabb', '#8197f4', '#f45deb'],
+    8: ['#f77189', '#ce9032', '#97a431', '#32b166', '#36ada4', '#39a7d0', '#a48cf4', '#f561dd'],
+    9: ['#f77189', '#d58c32', '#a4a031', '#50b131', '#34ae91', '#37abb5', '#3ba3ec', '#bb83f4',
+        '#f564d4'],
+    10: ['#f77189', '#dc8932', '#ae9d31', '#77ab31', '#33b07a', '#36ada4', '#38a9c5', '#6e9bf4',
+         '#cc7af4', '#f565cc'],
+    11: ['#f77189', '#e18632', '#b59a32', '#8ba731', '#32b258', '#35ae95', '#37abb2', '#39a7d6',
+         '#8f93f4', '#db70f4', '#f667c6'],
+    12: ['#f77189', '#e68332', '#bb9832', '#97a431', '#50b131', '#34af84', '#36ada4', '#38aabf',
+         '#3ba3ec', '#a48cf4', '#e866f4', '#f668c2'],
+    13: ['#f77189', '#eb8032', '#c19632', '#a0a131', '#71ac31', '#33b16f', '#35ae97', '#36abb0',
+         '#39a8cc', '#639df4', '#b486f4', '#f35cf4', '#f668be'],
+    14: ['#f77189', '#ef7d32', '#c69432', '#a79f31', '#82a931', '#32b24e', '#34af8a', '#36ada4',
+         '#37aabb', '#3aa6da', '#8197f4', '#c180f4', '#f45deb', '#f669ba'],
+    15: ['#f77189', '#f37a32', '#ca9232', '#ae9d31', '#8ea631', '#50b131', '#33b07a', '#35ae99',
+         '#36acae', '#38a9c5', '#3ba3ec', '#9591f4', '#cc7af4', '#f560e4', '#f66ab7'],
+    16: ['#f77189', '#f77732', '#ce9032', '#b39b32', '#97a431', '#6cad31', '#32b166', '#34af8e',
+         '#36ada4', '#37abb8', '#39a7d0', '#5a9ef4', '#a48cf4', '#d673f4', '#f561dd', '#f66ab5'],
+}
+
+# Bump whenever chart styling changes so cached charts get re-rendered
+_RENDER_VERSION = 2
+
+# Sample dataset copied into place when buildings.json is missing
+_SAMPLE_DATA_FILE = Path(__file__).with_name('_sample_data.json')
+
+# Columns used by the charts and the array dtype each one is stored as
+_COLUMNS = {
+    'building_name': object,
+    'fire_risk_score': np.int8,  # Only when every score is a whole number in 0-100
+    'building_type': object,
+}
+
 def load_buildings_data(filepath):
-    """Load building data from JSON file."""
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    """Load building data from JSON file into a dict of column arrays."""
+    with open(filepath, 'rb') as f:
+        if ijson is None:
+            records = json.load(f)
+        else:
+            # ijson picks its fastest available backend (yajl2_c when compiled)
+            records = ijson.items(f, 'item', use_float=True)
+        
+        # Records missing a field get None in that column
+        columns = {key: [] for key in _COLUMNS}
+        for record in records:
+            for key, values in columns.items():
+                values.append(record.get(key))
+    
+    if not columns['fire_risk_score']:
+        raise ValueError(f"No buildings found in {filepath}")
+    
+    # Drop a column only when no record has it
+    return {key: _column_array(key, values) for key, values in columns.items()
+            if any(value is not None for value in values)}
+
+def _column_array(key, values):
+    """Convert a column's values to an array of its dtype."""
+    dtype = _COLUMNS[key]
+    if dtype is object:
+        return np.asarray(values, dtype=object)
+    
+    # Downcast only when it's lossless; fractional, out of range or missing
+    # (NaN) scores keep the column as floats
+    array = np.asarray(values, dtype=float)
+    if np.all((array >= 0) & (array <= 100) & (array == np.floor(array))):
+        return array.astype(dtype)
+    return array
+
+def get_type_palette(n):
+    """Return n distinct colors for the building types."""
+    if n in _HUSL_PALETTES:
+        return _HUSL_PALETTES[n]
+    
+    # Rarely needed, so sample evenly spaced hues from matplotlib instead
+    from matplotlib import colormaps
+    return list(colormaps['hsv'](np.linspace(0, 1, n, endpoint=False)))
 
 def get_color_mapping(score):
     """Map risk scores to a color gradient from green to yellow to red."""
-    if score < 33:
-        return '#10B981'  # Green for low risk
-    elif score < 66:
-        return '#F59E0B'  # Yellow/Orange for medium risk
+    return str(get_color_mappings(np.asarray([score]))[0])
+
+def get_color_mappings(scores):
+    """Map an array of risk scores to their risk level colors in one pass."""
+    return _PALETTE[_risk_levels(scores)]
+
+def _risk_levels(scores):
+    """Bucket scores into risk levels (0 low, 1 medium, 2 high); NaN counts as high."""
+    return np.searchsorted(_THRESH, scores, side='right')
+
+def _sort_by_risk(scores):
+    """Return the descending order of scores and the risk level of each sorted score."""
+    scores = np.asarray(scores)
+    
+    # NumPy's stable argsort on 8/16-bit integers is a radix sort; NaN sorts last
+    order = np.argsort(-scores, kind='stable')
+    return order, _risk_levels(scores[order])
+
+@dataclass
+class SortedView:
+    """Building names, scores and bar colors sorted by descending risk score."""
+    names: np.ndarray
+    scores: np.ndarray
+    colors: np.ndarray
+
+def prepare(buildings_data):
+    """Sort building data once so several risk score charts can reuse it."""
+    order, levels = _sort_by_risk(buildings_data['fire_risk_score'])
+    return SortedView(names=buildings_data['building_name'][order],
+                      scores=buildings_data['fire_risk_score'][order],
+                      colors=_PALETTE[levels])
+
+def _cache_key(buildings_data, fmt):
+    """Hash the building data, output format and render version so unchanged charts can skip re-rendering."""
+    inputs = {
+        'version': _RENDER_VERSION,
+        'fmt': fmt,
+        'columns': {key: values.tolist() for key, values in buildings_data.items()},
+    }
+    if orjson is None:
+        payload = json.dumps(inputs, sort_keys=True, separators=(',', ':')).encode()
+    else:
+        payload = orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _is_cached(output_file, cache_key):
+    """Check whether output_file was already rendered from the same inputs."""
+    hash_file = Path(f"{output_file}.hash")
+    if not Path(output_file).exists() or not hash_file.exists():
+        return False
+    return hash_file.read_text() == cache_key
+
+def _write_cache_key(output_file, cache_key):
+    """Record the input hash next to output_file, replacing it atomically."""
+    hash_file = f"{output_file}.hash"
+    tmp_file = f"{hash_file}.tmp"
+    with open(tmp_file, 'w') as f:
+        f.write(cache_key)
+    os.replace(tmp_file, hash_file)
+
+def _remove_stale_chart(output_file):
+    """Delete a previously rendered chart and its hash so it can't pass as current."""
+    for path in (Path(output_file), Path(f"{output_file}.hash")):
+        if path.exists():
+            path.unlink()
+            print(f"Removed stale {path}")
+
+def _bar_collection(x, heights, width, colors, **kwargs):
+    """Build every bar as one PolyCollection rather than a Rectangle per bar."""
+    from matplotlib.collections import PolyCollection
+    
+    left = np.asarray(x, dtype=float) - width / 2
+    right = left + width
+    heights = np.asarray(heights, dtype=float)
+    zeros = np.zeros_like(heights)
+    
+    # (N, 4, 2) array of rectangle corners
+    verts = np.stack([np.stack([left, left, right, right], axis=1),
+                      np.stack([zeros, heights, heights, zeros], axis=1)], axis=-1)
+    bars = PolyCollection(verts, facecolors=colors, edgecolors='none', **kwargs)
+    
+    # Keep the y-axis anchored at zero like ax.bar does
+    bars.sticky_edges.y.append(0)
+    return bars
+
+def _save_figure(fig, output_file, fmt):
+    """Save a figure; SVG output skips rasterization entirely."""
+    from matplotlib import rc_context
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    rc = {}
+    if fmt == 'png':
+        # Lower dpi and light compression keep PNG encoding fast
+        options = dict(dpi=150, pil_kwargs={'compress_level': 1})
+    elif fmt == 'svg':
+        # Leave out the render timestamp and use a fixed id salt so unchanged
+        # data gives byte-identical files
+        options = dict(metadata={'Date': None})
+        rc['svg.hashsalt'] = 'firezero'
     else:
-        return '#EF4444'  # Red for high risk
+        options = {}
+    with rc_context(rc):
+        FigureCanvasAgg(fig).print_figure(output_file, format=fmt, **options)
 
-def create_risk_score_chart(buildings_data, output_file='risk_scores_chart.png'):
-    """Create a bar chart of building risk scores."""
-    # Extract building names and risk scores
-    building_names = [b['building_name'] for b in buildings_data]
-    risk_scores = [b['fire_risk_score'] for b in buildings_data]
+def _add_risk_thresholds(ax):
+    """Draw both risk level lines as a single LineCollection spanning the axes."""
+    from matplotlib.collections import LineCollection
     
-    # Sort buildings by risk score for better visualization
-    sorted_indices = np.argsort(risk_scores)[::-1]  # Sort in descending order
-    building_names = [building_names[i] for i in sorted_indices]
-    risk_scores = [risk_scores[i] for i in sorted_indices]
+    lines = LineCollection([[(0, 33), (1, 33)], [(0, 66), (1, 66)]],
+                           colors=['#10B981', '#EF4444'], linestyles='--', alpha=0.5,
+                           transform=ax.get_yaxis_transform())
+    ax.add_collection(lines, autolim=False)
     
-    # Create colors based on risk scores
-    bar_colors = [get_color_mapping(score) for score in risk_scores]
+    # Keep both thresholds in view like axhline would
+    ax.update_datalim([(0, 33), (0, 66)], updatex=False)
+
+def create_risk_score_chart(buildings_data, output_file=None, fmt='svg'):
+    """Create a bar chart of building risk scores from building data or a SortedView."""
+    # Imported lazily so loading data doesn't pay matplotlib's startup cost
+    from matplotlib.figure import Figure
+    
+    if output_file is None:
+        output_file = f'risk_scores_chart.{fmt}'
+    
+    # Skip rendering if the chart is up to date with the data, checking raw
+    # data before sorting so a cache hit costs only the hash
+    if isinstance(buildings_data, SortedView):
+        view = buildings_data
+        cache_key = _cache_key({'names': view.names, 'scores': view.scores, 'colors': view.colors}, fmt)
+    else:
+        view = None
+        cache_key = _cache_key(buildings_data, fmt)
+    if _is_cached(output_file, cache_key):
+        print(f"Chart {output_file} is up to date")
+        return None
+    
+    # Sort buildings by risk score (descending) unless the caller already did
+    if view is None:
+        view = prepare(buildings_data)
+    
+    building_names = view.names
+    risk_scores = view.scores
+    bar_colors = view.colors
     
     # Create figure with appropriate size based on number of buildings
-    plt.figure(figsize=(max(12, len(building_names) * 0.5), 8))
+    fig = Figure(figsize=(max(12, len(building_names) * 0.5), 8))
+    ax = fig.subplots()
     
     # Create bar chart
-    bars = plt.bar(range(len(building_names)), risk_scores, color=bar_colors)
+    ax.add_collection(_bar_collection(np.arange(len(building_names)), risk_scores, 0.8, bar_colors))
+    
+    # Add a horizontal line at risk levels
+    _add_risk_thresholds(ax)
+    ax.autoscale_view()
     
     # Set x-axis ticks and labels
-    plt.xticks(range(len(building_names)), building_names, rotation=45, ha='right')
+    ax.set_xticks(range(len(building_names)))
+    ax.set_xticklabels(building_names, rotation=45, ha='right')
     
     # Add labels and title
-    plt.xlabel('Building Name')
-    plt.ylabel('Fire Risk Score')
-    plt.title('UC Davis Buildings Fire Risk Assessment', fontsize=16, fontweight='bold')
-    
-    # Add a horizontal line at risk levels
-    plt.axhline(y=33, color='#10B981', linestyle='--', alpha=0.5)
-    plt.axhline(y=66, color='#EF4444', linestyle='--', alpha=0.5)
+    ax.set_xlabel('Building Name')
+    ax.set_ylabel('Fire Risk Score')
+    ax.set_title('UC Davis Buildings Fire Risk Assessment', fontsize=16, fontweight='bold')
     
     # Add risk level labels
-    plt.text(len(building_names)-1, 20, 'Low Risk', fontsize=10, ha='right', color='#10B981')
-    plt.text(len(building_names)-1, 50, 'Medium Risk', fontsize=10, ha='right', color='#F59E0B')
-    plt.text(len(building_names)-1, 85, 'High Risk', fontsize=10, ha='right', color='#EF4444')
+    for y, label, color in zip(_RISK_LABEL_Y, _RISK_LABELS, _PALETTE):
+        ax.text(len(building_names)-1, y, label, fontsize=10, ha='right', color=color)
     
-    # Add annotations for highest risk buildings
-    for i, (name, score) in enumerate(zip(building_names[:3], risk_scores[:3])):
-        plt.annotate(f"{score}", xy=(i, score), xytext=(0, 5),
+    # Add annotations for highest risk buildings, formatting the scores in one pass
+    top_scores = risk_scores[:3]
+    for i, (score, label) in enumerate(zip(top_scores, top_scores.astype(str))):
+        ax.annotate(label, xy=(i, score), xytext=(0, 5),
                     textcoords="offset points", ha='center', va='bottom', fontweight='bold')
     
     # Adjust layout
-    plt.tight_layout()
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    fig.tight_layout()
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
     
     # Save the figure
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    _save_figure(fig, output_file, fmt)
+    _write_cache_key(output_file, cache_key)
     print(f"Chart saved as {output_file}")
     
-    return plt
+    return fig
 
-def create_building_type_chart(buildings_data, output_file='risk_scores_by_type_chart.png'):
+def create_building_type_chart(buildings_data, output_file=None, fmt='svg'):
     """Create a grouped bar chart of building risk scores by building type."""
+    # Imported lazily so loading data doesn't pay matplotlib's startup cost
+    from matplotlib.figure import Figure
+    
+    if output_file is None:
+        output_file = f'risk_scores_by_type_chart.{fmt}'
+    
     # Check if building_type exists in the data
-    if 'building_type' not in buildings_data[0]:
+    if 'building_type' not in buildings_data:
         print("Building type information not available. Skipping grouped chart.")
+        _remove_stale_chart(output_file)
+        return None
+    
+    # Skip rendering if the chart is up to date with the data
+    cache_key = _cache_key(buildings_data, fmt)
+    if _is_cached(output_file, cache_key):
+        print(f"Grouped chart {output_file} is up to date")
         return None
     
     # Convert to pandas DataFrame for easier grouping
     df = pd.DataFrame(buildings_data)
     
-    # Group by building type
-    building_types = df['building_type'].unique()
+    # Factorize building types once into integer codes (in order of first
+    # appearance) so the rows are partitioned without string comparisons
+    codes, building_types = pd.factorize(df['building_type'], sort=False)
+    
+    # A single type would just repeat the risk score chart
+    if len(building_types) <= 1:
+        print("Only one building type present. Skipping grouped chart.")
+        _remove_stale_chart(output_file)
+        return None
     
     # Set up the figure
-    plt.figure(figsize=(max(14, len(building_types) * 4), 10))
+    fig = Figure(figsize=(max(14, len(building_types) * 4), 10))
+    ax = fig.subplots()
     
     # Set width of bars
     bar_width = 0.8 / len(building_types)
     
     # Set up color palette for building types
-    colors = sns.color_palette("husl", len(building_types))
+    colors = get_type_palette(len(building_types))
     
-    # Plot grouped bars
-    for i, (building_type, color) in enumerate(zip(building_types, colors)):
-        type_data = df[df['building_type'] == building_type]
-        indices = np.arange(len(type_data))
-        plt.bar(indices + i * bar_width, type_data['fire_risk_score'], 
-                width=bar_width, label=building_type, color=color)
-        
-        # Add building names as x-tick labels
-        plt.xticks(indices + bar_width * (len(building_types) - 1) / 2, 
-                  type_data['building_name'], rotation=45, ha='right')
+    # Partition row positions by type with one stable sort of the integer codes,
+    # leaving out buildings with no type (code -1)
+    typed = np.flatnonzero(codes >= 0)
+    type_rows = np.split(typed[np.argsort(codes[typed], kind='stable')],
+                         np.cumsum(np.bincount(codes[typed]))[:-1])
+    risk_scores = df['fire_risk_score'].to_numpy()
+    building_names = df['building_name'].to_numpy()
     
-    # Add labels and title
-    plt.xlabel('Building Name')
-    plt.ylabel('Fire Risk Score')
-    plt.title('UC Davis Buildings Fire Risk Assessment by Building Type', fontsize=16, fontweight='bold')
-    plt.legend(title="Building Type")
+    # Plot grouped bars
+    tick_positions = []
+    tick_labels = []
+    for i, (building_type, rows, color) in enumerate(zip(building_types, type_rows, colors)):
+        positions = np.arange(len(rows)) + i * bar_width
+        ax.add_collection(_bar_collection(positions, risk_scores[rows],
+                                          bar_width, [color], label=building_type))
+        tick_positions.append(positions)
+        tick_labels.append(building_names[rows])
     
     # Add risk level lines
-    plt.axhline(y=33, color='#10B981', linestyle='--', alpha=0.5)
-    plt.axhline(y=66, color='#EF4444', linestyle='--', alpha=0.5)
+    _add_risk_thresholds(ax)
+    ax.autoscale_view()
+    
+    # Label every bar with its building name, setting the ticks only once
+    ax.set_xticks(np.concatenate(tick_positions))
+    ax.set_xticklabels(np.concatenate(tick_labels), rotation=45, ha='right')
+    
+    # Add labels and title
+    ax.set_xlabel('Building Name')
+    ax.set_ylabel('Fire Risk Score')
+    ax.set_title('UC Davis Buildings Fire Risk Assessment by Building Type', fontsize=16, fontweight='bold')
+    ax.legend(title="Building Type")
     
     # Adjust layout
-    plt.tight_layout()
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    fig.tight_layout()
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
     
     # Save the figure
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    _save_figure(fig, output_file, fmt)
+    _write_cache_key(output_file, cache_key)
     print(f"Grouped chart saved as {output_file}")
     
-    return plt
+    return fig
+
+def _render_chart(chart_fn, buildings_data, output_file):
+    """Render a chart in a worker process, returning output_file if it was written."""
+    fig = chart_fn(buildings_data, output_file)
+    
+    # Cached or skipped charts return no figure and write nothing
+    if fig is None:
+        return None
+    
+    # Free the figure's artists before the worker takes the next chart
+    fig.clear()
+    return output_file
 
 def main():
     """Main function to run the visualization."""
     # Define input and output file paths
     buildings_file = 'buildings.json'
+    risk_chart_file = 'risk_scores_chart.svg'
+    type_chart_file = 'risk_scores_by_type_chart.svg'
     
-    # Check if sample data file exists, otherwise create a sample
+    # Check if sample data file exists, otherwise copy in the bundled sample
     if not Path(buildings_file).exists():
         print(f"Sample data file not found. Creating {buildings_file}")
-        sample_data = [
-            {
-                "building_name": "Tercero Residence Halls",
-                "fire_risk_score": 72,
-                "address": "Tercero Residence Halls, Davis, CA 95616",
-                "latitude": 38.5362,
-                "longitude": -121.7656,
-                "building_type": "Residential",
-                "fire_safety": {
-                    "sprinkler": {"full": False, "partial": True},
-                    "alarm": {
-                        "smoke": True,
-                        "duct": False,
-                        "manual_pull": True,
-                        "evac_device": False
-                    },
-                    "fire_separation": {"corridor": True, "room": False}
-                },
-                "num_fire_drills": 1,
-                "electricity": 620000,
-                "steam": 1200,
-                "chilled_water": 800,
-                "domestic_water": 950
-            },
-            {
-                "building_name": "Segundo Residence Halls",
-                "fire_risk_score": 65,
-                "address": "Segundo Residence Halls, Davis, CA 95616",
-                "latitude": 38.5396,
-                "longitude": -121.7587,
-                "building_type": "Residential",
-                "fire_safety": {
-                    "sprinkler": {"full": True, "partial": False},
-                    "alarm": {
-                        "smoke": True,
-                        "duct": True,
-                        "manual_pull": True,
-                        "evac_device": False
-                    },
-                    "fire_separation": {"corridor": True, "room": True}
-                },
-                "num_fire_drills": 2,
-                "electricity": 580000,
-                "steam": 1100,
-                "chilled_water": 700,
-                "domestic_water": 900
-            },
-            {
-                "building_name": "Sciences Laboratory Building",
-                "fire_risk_score": 45,
-                "address": "Sciences Laboratory Building, Davis, CA 95616",
-                "latitude": 38.5376,
-                "longitude": -121.7499,
-                "building_type": "Academic",
-                "fire_safety": {
-                    "sprinkler": {"full": True, "partial": False},
-                    "alarm": {
-                        "smoke": True,
-                        "duct": True,
-                        "manual_pull": True,
-                        "evac_device": True
-                    },
-                    "fire_separation": {"corridor": True, "room": True}
-                },
-                "num_fire_drills": 2,
-                "electricity": 480000,
-                "steam": 900,
-                "chilled_water": 600,
-                "domestic_water": 750
-            },
-            {
-                "building_name": "Memorial Union",
-                "fire_risk_score": 31,
-                "address": "Memorial Union, Davis, CA 95616",
-                "latitude": 38.5421,
-                "longitude": -121.7490,
-                "building_type": "Administrative",
-                "fire_safety": {
-                    "sprinkler": {"full": True, "partial": False},
-                    "alarm": {
-                        "smoke": True,
-                        "duct": True,
-                        "manual_pull": True,
-                        "evac_device": True
-                    },
-                    "fire_separation": {"corridor": True, "room": True}
-                },
-                "num_fire_drills": 2,
-                "electricity": 320000,
-                "steam": 600,
-                "chilled_water": 400,
-                "domestic_water": 500
-            },
-            {
-                "building_name": "Shields Library",
-                "fire_risk_score": 28,
-                "address": "Shields Library, Davis, CA 95616",
-                "latitude": 38.5404,
-                "longitude": -121.7490,
-                "building_type": "Academic",
-                "fire_safety": {
-                    "sprinkler": {"full": True, "partial": False},
-                    "alarm": {
-                        "smoke": True,
-                        "duct": True,
-                        "manual_pull": True,
-                        "evac_device": True
-                    },
-                    "fire_separation": {"corridor": True, "room": True}
-                },
-                "num_fire_drills": 2,
-                "electricity": 290000,
-                "steam": 550,
-                "chilled_water": 380,
-                "domestic_water": 450
-            },
-            {
-                "building_name": "Meyer Hall",
-                "fire_risk_score": 52,
-                "address": "Meyer Hall, Davis, CA 95616",
-                "latitude": 38.5342,
-                "longitude": -121.7575,
-                "building_type": "Research",
-                "fire_safety": {
-                    "sprinkler": {"full": False, "partial": True},
-                    "alarm": {
-                        "smoke": True,
-                        "duct": False,
-                        "manual_pull": True,
-                        "evac_device": False
-                    },
-                    "fire_separation": {"corridor": True, "room": False}
-                },
-                "num_fire_drills": 1,
-                "electricity": 510000,
-                "steam": 950,
-                "chilled_water": 650,
-                "domestic_water": 800
-            }
-        ]
-        with open(buildings_file, 'w') as f:
-            json.dump(sample_data, f, indent=2)
+        shutil.copyfile(_SAMPLE_DATA_FILE, buildings_file)
     
     # Load data
     buildings_data = load_buildings_data(buildings_file)
     
-    # Create visualization
-    create_risk_score_chart(buildings_data)
-    
-    # Try to create grouped chart by building type
-    try:
-        create_building_type_chart(buildings_data)
-    except Exception as e:
-        print(f"Couldn't create grouped chart: {e}")
+    # Render both charts in parallel since they are independent
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        risk_chart = executor.submit(_render_chart, create_risk_score_chart, buildings_data, risk_chart_file)
+        type_chart = executor.submit(_render_chart, create_building_type_chart, buildings_data, type_chart_file)
+        
+        # Create visualization
+        generated = [risk_chart.result()]
         
+        # Try to create grouped chart by building type
+        try:
+            generated.append(type_chart.result())
+        except Exception as e:
+            print(f"Couldn't create grouped chart: {e}")
+    
+    generated = [output_file for output_file in generated if output_file is not None]
     print("Visualization complete!")
-    print("The following files were generated:")
-    print("- risk_scores_chart.png")
-    print("- risk_scores_by_type_chart.png")
+    if generated:
+        print("The following files were generated:")
+        for output_file in generated:
+            print(f"- {output_file}")
+    else:
+        print("No files were generated.")
 
 if __name__ == "__main__":
     main()